@@ -3,7 +3,7 @@
 import logging
 from importlib.metadata import PackageNotFoundError, version
 
-from destinepyauth.get_token import get_token
+from destinepyauth.get_token import get_token, get_token_async
 from destinepyauth.authentication import AuthenticationService, TokenResult
 from destinepyauth.exceptions import AuthenticationError
 
@@ -15,6 +15,7 @@ except PackageNotFoundError:
 
 __all__ = [
     "get_token",
+    "get_token_async",
     "TokenResult",
     "AuthenticationService",
     "AuthenticationError",
@@ -4,25 +4,75 @@ import getpass
 import json
 import logging
 import stat
+import threading
 import time
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
-from typing import Tuple, Optional, Dict, Any
+from urllib.parse import parse_qs, quote_plus, urlparse
+from typing import TYPE_CHECKING, Tuple, Optional, Dict, Any
 from dataclasses import dataclass
 
 import base64
 import requests
+from requests.adapters import HTTPAdapter
 from lxml import html
 from lxml.etree import ParserError
+from urllib3.util.retry import Retry
 
-from joserfc import jwt as joserfc_jwt
-from joserfc.jwk import KeySet
-
-from destinepyauth.configs import BaseConfig
 from destinepyauth.exceptions import AuthenticationError, handle_http_errors
 
+try:
+    # Optional C-accelerated parser for token endpoint responses.
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+if TYPE_CHECKING:
+    from destinepyauth.configs import BaseConfig
+
 logger = logging.getLogger(__name__)
 
+# Shared across all sessions so connections (and their TLS handshakes) to the IAM
+# and token-exchange endpoints are reused between logins. Cookies stay per-session.
+# urllib3 keeps one pool per host, sized for many concurrent logins to the same host.
+# Status retries only apply to idempotent methods (not the token POSTs), and
+# Retry-After is ignored so a 503 cannot stall a login for an arbitrary time.
+_HTTP_ADAPTER = HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=50,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[502, 503, 504],
+        raise_on_status=False,
+        respect_retry_after_header=False,
+    ),
+)
+
+
+def _build_session() -> requests.Session:
+    """Create a requests session backed by the shared connection pool."""
+    session = requests.Session()
+    session.mount("https://", _HTTP_ADAPTER)
+    return session
+
+
+# Constant part of the RFC 8693 token-exchange form body, encoded once.
+_TOKEN_EXCHANGE_FORM_PREFIX = (
+    f"grant_type={quote_plus('urn:ietf:params:oauth:grant-type:token-exchange')}"
+    f"&subject_token_type={quote_plus('urn:ietf:params:oauth:token-type:access_token')}"
+)
+
+
+# Serializes writes to ~/.netrc and ~/.polytopeapirc across threads.
+_CREDENTIAL_FILES_LOCK = threading.Lock()
+
+
+def _body_excerpt(response: requests.Response, limit: int) -> str:
+    """Decode at most ``limit`` characters from the start of a response body."""
+    # Unlike response.text, this never decodes (or charset-sniffs) the whole body,
+    # which matters when an IdP answers with a large HTML error page.
+    return response.content[: limit * 4].decode("utf-8", errors="replace")[:limit]
+
 
 @dataclass
 class TokenResult:
@@ -46,7 +96,7 @@ class AuthenticationService:
 
     def __init__(
         self,
-        config: BaseConfig,
+        config: "BaseConfig",
         service_name: Optional[str] = None,
         netrc_host: Optional[str] = None,
     ) -> None:
@@ -63,20 +113,20 @@ class AuthenticationService:
         self.scope = config.scope
         self.exchange_config = config.exchange_config
         self.decoded_token: Optional[Dict[str, Any]] = None
-        self.session = requests.Session()
+        self.session = _build_session()
         self.jwks_uri: Optional[str] = None
         self.netrc_host = netrc_host
         if not self.netrc_host and config.iam_redirect_uri:
             self.netrc_host = urlparse(config.iam_redirect_uri).netloc
 
         logger.debug("Configuration loaded:")
-        logger.debug(f"  IAM URL: {self.config.iam_url}")
-        logger.debug(f"  IAM Realm: {self.config.iam_realm}")
-        logger.debug(f"  IAM Client: {self.config.iam_client}")
-        logger.debug(f"  Service Name: {self.service_name}")
-        logger.debug(f"  Redirect URI: {self.config.iam_redirect_uri}")
-        logger.debug(f"  Scope: {self.scope}")
-        logger.debug(f"  Netrc Host: {self.netrc_host}")
+        logger.debug("  IAM URL: %s", self.config.iam_url)
+        logger.debug("  IAM Realm: %s", self.config.iam_realm)
+        logger.debug("  IAM Client: %s", self.config.iam_client)
+        logger.debug("  Service Name: %s", self.service_name)
+        logger.debug("  Redirect URI: %s", self.config.iam_redirect_uri)
+        logger.debug("  Scope: %s", self.scope)
+        logger.debug("  Netrc Host: %s", self.netrc_host)
 
         if self.exchange_config:
             logger.debug("Exchange config loaded")
@@ -197,13 +247,16 @@ class AuthenticationService:
 
         if response.status_code != 200:
             try:
-                error_data: Dict[str, Any] = response.json()
+                error_data: Dict[str, Any] = _json_loads(response.content)
                 error_msg = error_data.get("error_description", error_data.get("error", "Unknown"))
             except Exception:
-                error_msg = response.text[:100]
+                error_msg = _body_excerpt(response, 100)
             raise AuthenticationError(f"Token exchange failed: {error_msg}")
 
-        data: Dict[str, Any] = response.json()
+        try:
+            data: Dict[str, Any] = _json_loads(response.content)
+        except ValueError:
+            raise AuthenticationError("Invalid JSON in token response")
 
         if "access_token" not in data and "refresh_token" not in data:
             raise AuthenticationError("No token in response")
@@ -217,56 +270,70 @@ class AuthenticationService:
 
         netrc_path = netrc_path or Path.home() / ".netrc"
 
-        # Read existing content
-        existing_lines: list[str] = []
-        if netrc_path.exists():
-            existing_lines = netrc_path.read_text().splitlines()
-
-        # Check if entry for this machine already exists
-        updated = False
-        output_lines: list[str] = []
-        i = 0
-        while i < len(existing_lines):
-            line = existing_lines[i]
-            if line.strip().startswith(f"machine {self.netrc_host}"):
-                # Skip this machine's existing entry (machine + login + password lines)
+        # Held for the whole read-modify-write so concurrent logins
+        # (e.g. get_token_async) cannot drop each other's entries.
+        with _CREDENTIAL_FILES_LOCK:
+            # Read existing content
+            existing_lines: list[str] = []
+            if netrc_path.exists():
+                existing_lines = netrc_path.read_text().splitlines()
+
+            # Check if entry for this machine already exists
+            updated = False
+            output_lines: list[str] = []
+            i = 0
+            while i < len(existing_lines):
+                line = existing_lines[i]
+                if line.strip().startswith(f"machine {self.netrc_host}"):
+                    # Skip this machine's existing entry (machine + login + password lines)
+                    output_lines.append(f"machine {self.netrc_host}")
+                    output_lines.append("    login anonymous")
+                    output_lines.append(f"    password {token}")
+                    updated = True
+                    i += 1
+                    # Skip following indented lines (login, password) for this machine
+                    while i < len(existing_lines) and (
+                        existing_lines[i].startswith("    ")
+                        or existing_lines[i].startswith("\t")
+                        or existing_lines[i].strip().startswith("login")
+                        or existing_lines[i].strip().startswith("password")
+                    ):
+                        i += 1
+                else:
+                    output_lines.append(line)
+                    i += 1
+
+            if not updated:
+                # Append new entry
+                if output_lines and output_lines[-1].strip():
+                    output_lines.append("")  # Add blank line before new entry
                 output_lines.append(f"machine {self.netrc_host}")
                 output_lines.append("    login anonymous")
                 output_lines.append(f"    password {token}")
-                updated = True
-                i += 1
-                # Skip following indented lines (login, password) for this machine
-                while i < len(existing_lines) and (
-                    existing_lines[i].startswith("    ")
-                    or existing_lines[i].startswith("\t")
-                    or existing_lines[i].strip().startswith("login")
-                    or existing_lines[i].strip().startswith("password")
-                ):
-                    i += 1
-            else:
-                output_lines.append(line)
-                i += 1
-
-        if not updated:
-            # Append new entry
-            if output_lines and output_lines[-1].strip():
-                output_lines.append("")  # Add blank line before new entry
-            output_lines.append(f"machine {self.netrc_host}")
-            output_lines.append("    login anonymous")
-            output_lines.append(f"    password {token}")
 
-        # Write file with secure permissions
-        netrc_path.write_text("\n".join(output_lines) + "\n")
-        netrc_path.chmod(stat.S_IRUSR | stat.S_IWUSR)  # 600 permissions
+            # Write file with secure permissions
+            netrc_path.write_text("\n".join(output_lines) + "\n")
+            netrc_path.chmod(stat.S_IRUSR | stat.S_IWUSR)  # 600 permissions
 
-        logger.info(f"Updated .netrc entry for {self.netrc_host}")
+        logger.info("Updated .netrc entry for %s", self.netrc_host)
 
     def _write_polytopeapirc(self, token: str, outpath: Optional[Path] = None) -> None:
         """Write Polytope refresh token to ~/.polytopeapirc."""
         outpath = outpath or Path.home() / ".polytopeapirc"
-        outpath.write_text(json.dumps({"user_key": token}) + "\n")
-        outpath.chmod(stat.S_IRUSR | stat.S_IWUSR)  # 600 permissions
-        logger.info(f"Updated Polytope token file at {outpath}")
+        with _CREDENTIAL_FILES_LOCK:
+            outpath.write_text(json.dumps({"user_key": token}) + "\n")
+            outpath.chmod(stat.S_IRUSR | stat.S_IWUSR)  # 600 permissions
+        logger.info("Updated Polytope token file at %s", outpath)
+
+    @handle_http_errors("Failed to fetch JWKS")
+    def _fetch_jwks(self, issuer: str) -> Dict[str, Any]:
+        """Discover the issuer's JWKS URI and fetch its key set."""
+        # This automatically handles Keycloak, Auth0, etc.
+        # Fetched over the pooled session so the connection opened for the
+        # token exchange (usually the same host) is reused.
+        oidc_config = self.session.get(f"{issuer}/.well-known/openid-configuration", timeout=10).json()
+        jwks: Dict[str, Any] = self.session.get(oidc_config["jwks_uri"], timeout=10).json()
+        return jwks
 
     def _verify_and_decode(self, token: str, leeway: int = 30) -> Optional[Dict[str, Any]]:
         """
@@ -279,6 +346,11 @@ class AuthenticationService:
         Returns:
             The decoded token payload, or None if verification fails.
         """
+        # Imported here: joserfc pulls in cryptography, which is only needed once a
+        # token is actually verified.
+        from joserfc import jwt as joserfc_jwt
+        from joserfc.jwk import KeySet
+
         logger.debug("Verifying token...")
 
         # ---- 1. Extract header and payload without verifying ----
@@ -297,15 +369,10 @@ class AuthenticationService:
         if not kid:
             raise AuthenticationError("Invalid token: missing key ID (kid)")
 
-        # ---- 2. Discover issuer JWKS URI ----
-        # This automatically handles Keycloak, Auth0, etc.
-        oidc_config = requests.get(f"{issuer}/.well-known/openid-configuration").json()
-        jwks_uri = oidc_config["jwks_uri"]
+        # ---- 2. Discover issuer JWKS URI and fetch JWKS ----
+        jwks = KeySet.import_key_set(self._fetch_jwks(issuer))
 
-        # ---- 3. Fetch JWKS ----
-        jwks = KeySet.import_key_set(requests.get(jwks_uri).json())
-
-        # ---- 4. Verify the token signature and claims ----
+        # ---- 3. Verify the token signature and claims ----
         try:
             token_obj = joserfc_jwt.decode(
                 token,
@@ -331,10 +398,11 @@ class AuthenticationService:
                 raise AuthenticationError("Token was issued in the future")
 
             logger.info("Token verified successfully")
-            logger.debug(json.dumps(claims, indent=2))
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(json.dumps(claims, indent=2))
             return claims
         except Exception as e:
-            logger.error(f"Token verification failed: {e}")
+            logger.error("Token verification failed: %s", e)
             return None
 
     @handle_http_errors("Failed to exchange token")
@@ -357,36 +425,44 @@ class AuthenticationService:
         if not self.exchange_config:
             raise AuthenticationError("No exchange configuration provided")
 
-        data: Dict[str, Any] = {
-            "grant_type": "urn:ietf:params:oauth:grant-type:token-exchange",
-            "subject_token": subject_token,
-            "subject_issuer": self.exchange_config.subject_issuer,
-            "subject_token_type": "urn:ietf:params:oauth:token-type:access_token",
-            "client_id": self.exchange_config.client_id,
-            "audience": self.exchange_config.audience,
-        }
+        # Encoded here rather than by requests: only the per-call fields need quoting.
+        # None values are dropped, as requests does for form dicts.
+        fields = (
+            ("subject_token", subject_token),
+            ("subject_issuer", self.exchange_config.subject_issuer),
+            ("client_id", self.exchange_config.client_id),
+            ("audience", self.exchange_config.audience),
+        )
+        body = "&".join(
+            [_TOKEN_EXCHANGE_FORM_PREFIX]
+            + [f"{key}={quote_plus(value)}" for key, value in fields if value is not None]
+        )
 
         logger.debug("Exchanging token via RFC8693")
-        logger.debug(f"Token URL: {self.exchange_config.token_url}")
-        logger.debug(f"Client ID: {self.exchange_config.client_id}")
-        logger.debug(f"Audience: {self.exchange_config.audience}")
-        logger.debug(f"Subject issuer: {self.exchange_config.subject_issuer}")
+        logger.debug("Token URL: %s", self.exchange_config.token_url)
+        logger.debug("Client ID: %s", self.exchange_config.client_id)
+        logger.debug("Audience: %s", self.exchange_config.audience)
+        logger.debug("Subject issuer: %s", self.exchange_config.subject_issuer)
 
         response = self.session.post(
             self.exchange_config.token_url,
-            data=data,
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            data=body.encode(),
             timeout=10,
         )
 
         if response.status_code != 200:
             try:
-                error_data = response.json()
+                error_data = _json_loads(response.content)
                 error_msg = error_data.get("error_description", error_data.get("error", "Unknown"))
             except Exception:
-                error_msg = response.text[:200]
+                error_msg = _body_excerpt(response, 200)
             raise AuthenticationError(f"Exchange failed: {error_msg}")
 
-        result: Dict[str, Any] = response.json()
+        try:
+            result: Dict[str, Any] = _json_loads(response.content)
+        except ValueError:
+            raise AuthenticationError("Invalid JSON in exchange response")
         exchanged_token: Optional[str] = result.get("access_token")
         if not exchanged_token:
             raise AuthenticationError("No access token in exchange response")
@@ -412,7 +488,7 @@ class AuthenticationService:
         """
         user, password = self._get_credentials()
 
-        logger.info(f"Authenticating on {self.config.iam_url}")
+        logger.info("Authenticating on %s", self.config.iam_url)
 
         # Get login form action, submit credentials and extract auth code
         auth_action_url = self._get_auth_url_action()
@@ -1,5 +1,6 @@
 """High-level API for DESP authentication."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Optional
@@ -7,6 +8,8 @@ from typing import Optional
 from destinepyauth.authentication import AuthenticationService, TokenResult
 from destinepyauth.services import ConfigurationFactory
 
+_LIB_LOGGER = logging.getLogger("destinepyauth")
+
 
 def get_token(
     service: Optional[str] = None,
@@ -49,8 +52,11 @@ def get_token(
 
     # Configure only the library logger (do not change the root logger).
     # Applications (including notebooks) should configure handlers.
+    # setLevel takes the logging module lock and clears every logger's level cache,
+    # so only call it when the level actually changes.
     log_level = logging.INFO if not verbose else logging.DEBUG
-    logging.getLogger("destinepyauth").setLevel(log_level)
+    if _LIB_LOGGER.level != log_level:
+        _LIB_LOGGER.setLevel(log_level)
 
     # Load configuration for the service
     config = ConfigurationFactory.load_config(service_name, config_path=config_path)
@@ -62,3 +68,43 @@ def get_token(
 
     if not write_netrc:
         return result
+
+
+async def get_token_async(
+    service: Optional[str] = None,
+    config_path: Optional[str] = None,
+    write_netrc: bool = False,
+    verbose: bool = False,
+) -> Optional[TokenResult]:
+    """
+    Asynchronous variant of get_token().
+
+    Runs the authentication flow in a worker thread so several services can be
+    authenticated concurrently, e.g. with asyncio.gather(). The sessions share
+    one connection pool, so network round-trips to the IAM overlap.
+
+    Credentials should be provided via DESPAUTH_USER and DESPAUTH_PASSWORD when
+    authenticating concurrently, since interactive prompts would interleave.
+
+    Args:
+        service: Service name (e.g., 'highway', 'cacheb', 'eden'). Optional when
+            config_path is provided.
+        config_path: Optional path to a custom YAML config file.
+        write_netrc: If True, write/update the token in ~/.netrc file.
+        verbose: If True, enable DEBUG logging.
+
+    Returns:
+        TokenResult containing the access token and decoded payload.
+        Returns None if write_netrc=True to prevent token exposure in output.
+
+    Raises:
+        AuthenticationError: If authentication fails.
+        ValueError: If the service or config_path are missing or invalid.
+    """
+    return await asyncio.to_thread(
+        get_token,
+        service=service,
+        config_path=config_path,
+        write_netrc=write_netrc,
+        verbose=verbose,
+    )
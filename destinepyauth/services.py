@@ -1,21 +1,37 @@
 """Service registry and configuration factory."""
 
+import hashlib
+import os
+import sys
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, List, Mapping, Optional, Tuple
 
-from conflator import Conflator
-
-from destinepyauth.configs import BaseConfig
+if TYPE_CHECKING:
+    from destinepyauth.configs import BaseConfig
 
 
 class ServiceRegistry:
     """Registry mapping service names to their configuration."""
 
+    # Built-in configs ship with the package and do not change at runtime, so the
+    # configs directory is scanned once and then served from this read-only mapping.
+    _SERVICE_CONFIGS: Optional[Mapping[str, Path]] = None
+
     @classmethod
     def _get_configs_dir(cls) -> Path:
         """Get the path to the configs directory."""
         return Path(__file__).parent / "configs"
 
+    @classmethod
+    def _get_service_configs(cls) -> Mapping[str, Path]:
+        """Get the (cached) mapping of service names to their YAML config paths."""
+        if cls._SERVICE_CONFIGS is None:
+            configs_dir = cls._get_configs_dir()
+            paths = sorted(configs_dir.glob("*.yaml")) if configs_dir.exists() else []
+            cls._SERVICE_CONFIGS = MappingProxyType({f.stem: f for f in paths})
+        return cls._SERVICE_CONFIGS
+
     @classmethod
     def list_services(cls) -> list[str]:
         """
@@ -24,10 +40,7 @@ class ServiceRegistry:
         Returns:
             List of registered service names (based on available YAML files).
         """
-        configs_dir = cls._get_configs_dir()
-        if not configs_dir.exists():
-            return []
-        return [f.stem for f in configs_dir.glob("*.yaml")]
+        return list(cls._get_service_configs())
 
     @classmethod
     def service_config_exists(cls, service_name: str) -> bool:
@@ -40,8 +53,7 @@ class ServiceRegistry:
         Returns:
             True if the service config file exists.
         """
-        config_file = cls._get_configs_dir() / f"{service_name}.yaml"
-        return config_file.exists()
+        return service_name in cls._get_service_configs()
 
     @classmethod
     def get_service_config_path(cls, service_name: str) -> Path:
@@ -57,17 +69,61 @@ class ServiceRegistry:
         Raises:
             ValueError: If the service configuration file doesn't exist.
         """
-        if not cls.service_config_exists(service_name):
-            available = ", ".join(cls.list_services())
-            raise ValueError(f"Unknown service: {service_name}. Available: {available}")
-        return cls._get_configs_dir() / f"{service_name}.yaml"
+        service_configs = cls._get_service_configs()
+        try:
+            return service_configs[service_name]
+        except KeyError:
+            available = ", ".join(service_configs)
+            raise ValueError(f"Unknown service: {service_name}. Available: {available}") from None
 
 
 class ConfigurationFactory:
     """Factory for loading service configurations using Conflator."""
 
+    # Validated configs keyed by everything Conflator reads: the YAML files (and their
+    # mtimes, including extra -f/--config files from argv), a hash of the DESPAUTH_*
+    # environment variables and the command-line arguments. Oldest entries are
+    # evicted beyond _CONFIG_CACHE_MAX_SIZE.
+    _CONFIG_CACHE: Dict[Tuple[Any, ...], "BaseConfig"] = {}
+    _CONFIG_CACHE_MAX_SIZE = 32
+
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Drop all cached configurations."""
+        cls._CONFIG_CACHE.clear()
+
     @staticmethod
-    def load_config(service_name: str, config_path: Optional[str] = None) -> BaseConfig:
+    def _extra_config_files(argv: List[str]) -> Tuple[Tuple[str, Optional[int]], ...]:
+        """
+        Find the extra config files Conflator reads from its -f/--config option.
+
+        Args:
+            argv: Command-line arguments (without the program name).
+
+        Returns:
+            Tuple of (path, mtime in ns or None if missing) per extra config file.
+        """
+        paths: List[str] = []
+        for i, arg in enumerate(argv):
+            option, sep, value = arg.partition("=")
+            if arg == "-f" or (len(option) > 2 and "--config".startswith(option)):
+                if sep:
+                    paths.append(value)
+                elif i + 1 < len(argv):
+                    paths.append(argv[i + 1])
+            elif arg.startswith("-f") and not arg.startswith("--"):
+                paths.append(arg[2:])
+
+        entries = []
+        for path in paths:
+            try:
+                entries.append((path, Path(path).stat().st_mtime_ns))
+            except OSError:
+                entries.append((path, None))
+        return tuple(entries)
+
+    @classmethod
+    def load_config(cls, service_name: str, config_path: Optional[str] = None) -> "BaseConfig":
         """
         Load configuration for a service.
 
@@ -75,6 +131,9 @@ class ConfigurationFactory:
         custom YAML file path, then applies environment/CLI overrides handled by
         Conflator.
 
+        Parsed configurations are cached per process; each call returns a
+        deep copy so callers can modify it freely.
+
         Args:
             service_name: Name of the service to configure.
             config_path: Optional path to a custom service YAML config.
@@ -94,9 +153,32 @@ class ConfigurationFactory:
         else:
             resolved_config_path = ServiceRegistry.get_service_config_path(service_name)
 
-        # Load config using Conflator with the service YAML as the config file
-        # Conflator uses the selected YAML file as base config and then applies
-        # environment/CLI overrides.
-        config = Conflator("despauth", BaseConfig, config_file=resolved_config_path).load()
-
-        return config
+        # Hashed so credentials such as DESPAUTH_PASSWORD are not kept in the key.
+        env_digest = hashlib.sha256(
+            repr(sorted((k, v) for k, v in os.environ.items() if k.startswith("DESPAUTH_"))).encode()
+        ).hexdigest()
+        argv = sys.argv[1:]
+        cache_key = (
+            str(resolved_config_path),
+            resolved_config_path.stat().st_mtime_ns,
+            cls._extra_config_files(argv),
+            env_digest,
+            tuple(argv),
+        )
+        config = cls._CONFIG_CACHE.get(cache_key)
+        if config is None:
+            # Imported here: conflator and pydantic dominate import time and are not
+            # needed by callers that only inspect the registry (e.g. the CLI help).
+            from conflator import Conflator
+
+            from destinepyauth.configs import BaseConfig
+
+            # Load config using Conflator with the service YAML as the config file
+            # Conflator uses the selected YAML file as base config and then applies
+            # environment/CLI overrides.
+            config = Conflator("despauth", BaseConfig, config_file=resolved_config_path).load()
+            while len(cls._CONFIG_CACHE) >= cls._CONFIG_CACHE_MAX_SIZE:
+                del cls._CONFIG_CACHE[next(iter(cls._CONFIG_CACHE))]
+            cls._CONFIG_CACHE[cache_key] = config
+
+        return config.model_copy(deep=True)
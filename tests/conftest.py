@@ -0,0 +1,13 @@
+"""Shared pytest fixtures."""
+
+import pytest
+
+from destinepyauth.services import ConfigurationFactory
+
+
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Start every test with an empty configuration cache."""
+    ConfigurationFactory.clear_cache()
+    yield
+    ConfigurationFactory.clear_cache()
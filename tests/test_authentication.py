@@ -9,6 +9,7 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 import stat
 import json
+import threading
 from unittest.mock import MagicMock
 import requests
 
@@ -86,6 +87,31 @@ class TestAuthenticationServiceNetrc:
             assert "password new_token_456" in content
             assert "password old_token" not in content
 
+    def test_write_netrc_concurrent_hosts_keep_all_entries(self):
+        """Test that concurrent writes for different hosts do not drop each other's entries."""
+        config = BaseConfig(iam_client="test-client")
+        hosts = [f"host{i}.example.com" for i in range(8)]
+
+        with TemporaryDirectory() as tmpdir:
+            netrc_path = Path(tmpdir) / ".netrc"
+            barrier = threading.Barrier(len(hosts), timeout=5)
+
+            def write(host):
+                auth_service = AuthenticationService(config=config, netrc_host=host)
+                barrier.wait()
+                auth_service._write_netrc(f"token_{host}", netrc_path=netrc_path)
+
+            threads = [threading.Thread(target=write, args=(host,)) for host in hosts]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            content = netrc_path.read_text()
+            for host in hosts:
+                assert f"machine {host}" in content
+                assert f"password token_{host}" in content
+
     def test_write_netrc_no_host_raises_error(self):
         """Test that writing netrc without host configured raises error."""
         config = BaseConfig(iam_client="test-client")
@@ -226,3 +252,28 @@ class TestAuthenticationOTPFlow:
 
         with pytest.raises(AuthenticationError, match="Failed to submit OTP"):
             auth_service._submit_otp("https://auth.example/otp", "123456")
+
+
+class TestAuthenticationSession:
+    """Tests for HTTP session setup."""
+
+    def test_sessions_share_connection_pool(self):
+        """Test that separate services reuse one HTTPS adapter but keep their own cookies."""
+        config = BaseConfig(iam_client="test")
+        first = AuthenticationService(config=config)
+        second = AuthenticationService(config=config)
+
+        assert first.session is not second.session
+        assert first.session.cookies is not second.session.cookies
+        assert first.session.get_adapter("https://auth.destine.eu") is second.session.get_adapter(
+            "https://highway.esa.int"
+        )
+
+    def test_retries_do_not_honour_retry_after(self):
+        """Test that a Retry-After header cannot stall a login."""
+        config = BaseConfig(iam_client="test")
+        auth_service = AuthenticationService(config=config)
+
+        retry = auth_service.session.get_adapter("https://auth.destine.eu").max_retries
+        assert retry.respect_retry_after_header is False
+        assert "POST" not in retry.allowed_methods
@@ -4,11 +4,13 @@ Unit tests for get_token high-level API.
 Tests core behavior: return values, logging, and error propagation.
 """
 
+import asyncio
 import logging
+import threading
 import pytest
 from unittest.mock import patch, MagicMock, ANY
 
-from destinepyauth.get_token import get_token
+from destinepyauth.get_token import get_token, get_token_async
 from destinepyauth.authentication import TokenResult
 from destinepyauth.exceptions import AuthenticationError
 
@@ -107,3 +109,37 @@ class TestGetToken:
         """Test that get_token raises when neither service nor config_path are provided."""
         with pytest.raises(ValueError, match="Either service or config_path must be provided"):
             get_token()
+
+
+class TestGetTokenAsync:
+    """Tests for get_token_async() function."""
+
+    def test_get_token_async_runs_services_concurrently(self):
+        """Test that gathered get_token_async calls log in concurrently and return in order."""
+
+        # Both logins must be in flight at once to pass the barrier; a serial
+        # implementation would hit the timeout and raise BrokenBarrierError.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_auth(config, service_name):
+            def login(write_netrc):
+                barrier.wait()
+                return TokenResult(access_token=f"{service_name}_token")
+
+            mock_auth = MagicMock()
+            mock_auth.login.side_effect = login
+            return mock_auth
+
+        async def gather_tokens():
+            return await asyncio.gather(get_token_async("highway"), get_token_async("hda"))
+
+        with patch("destinepyauth.get_token.ConfigurationFactory.load_config"):
+            with patch("destinepyauth.get_token.AuthenticationService", side_effect=fake_auth):
+                results = asyncio.run(gather_tokens())
+
+        assert [r.access_token for r in results] == ["highway_token", "hda_token"]
+
+    def test_get_token_async_propagates_errors(self):
+        """Test that validation errors surface from the awaited call."""
+        with pytest.raises(ValueError, match="Either service or config_path must be provided"):
+            asyncio.run(get_token_async())
@@ -4,10 +4,13 @@ Unit tests for service registry and configuration factory.
 Tests ServiceRegistry and ConfigurationFactory functionality.
 """
 
+import os
+import sys
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 
-from destinepyauth.configs import BaseExchangeConfig
+from destinepyauth.configs import BaseConfig, BaseExchangeConfig
 from destinepyauth.services import ServiceRegistry, ConfigurationFactory
 
 
@@ -22,6 +25,13 @@ class TestServiceRegistry:
         assert "cacheb" in services
         assert "eden" in services
 
+    def test_list_services_returns_independent_copy(self):
+        """Test that mutating the returned list does not affect the registry."""
+        services = ServiceRegistry.list_services()
+        assert services == sorted(services)
+        services.clear()
+        assert "highway" in ServiceRegistry.list_services()
+
     def test_service_config_exists(self):
         """Test checking if service config exists."""
         assert ServiceRegistry.service_config_exists("highway")
@@ -106,6 +116,68 @@ iam_redirect_uri: https://custom.example.com/
         assert config.iam_client == "custom-public"
         assert config.iam_redirect_uri == "https://custom.example.com/"
 
+    def test_load_config_reuses_parsed_config(self):
+        """Test that repeated loads parse once but hand out independent copies."""
+        with patch("conflator.Conflator") as mock_conflator:
+            mock_conflator.return_value.load.return_value = BaseConfig(iam_client="highway-public")
+
+            first = ConfigurationFactory.load_config("highway")
+            first.iam_client = "modified"
+            second = ConfigurationFactory.load_config("highway")
+
+            assert mock_conflator.call_count == 1
+            assert second.iam_client == "highway-public"
+
+    def test_load_config_cache_respects_env_changes(self, monkeypatch):
+        """Test that changing DESPAUTH_* env vars bypasses the cached config."""
+        assert ConfigurationFactory.load_config("highway").iam_url == "https://auth.destine.eu"
+
+        monkeypatch.setenv("DESPAUTH_IAM_URL", "https://other.example.com")
+
+        assert ConfigurationFactory.load_config("highway").iam_url == "https://other.example.com"
+
+    def test_load_config_cache_respects_extra_config_file_changes(self, tmp_path: Path, monkeypatch):
+        """Test that editing a -f/--config file passed on the command line bypasses the cache."""
+        extra = tmp_path / "extra.yaml"
+        extra.write_text("iam_realm: first\n")
+        monkeypatch.setattr(sys, "argv", ["prog", "--config", str(extra)])
+
+        assert ConfigurationFactory.load_config("highway").iam_realm == "first"
+
+        extra.write_text("iam_realm: second\n")
+        os.utime(extra, ns=(extra.stat().st_atime_ns, extra.stat().st_mtime_ns + 1_000_000_000))
+
+        assert ConfigurationFactory.load_config("highway").iam_realm == "second"
+
+    def test_extra_config_files_from_argv(self, tmp_path: Path):
+        """Test that every argparse spelling of -f/--config is picked up."""
+        extra = tmp_path / "extra.yaml"
+        extra.write_text("scope: openid\n")
+        argv = ["-f", str(extra), f"-f{extra}", f"--config={extra}", "--conf", "missing.yaml", "-v"]
+
+        entries = ConfigurationFactory._extra_config_files(argv)
+
+        mtime = extra.stat().st_mtime_ns
+        assert entries == ((str(extra), mtime),) * 3 + (("missing.yaml", None),)
+
+    def test_load_config_cache_key_does_not_hold_env_values(self, monkeypatch):
+        """Test that secrets from the environment are not stored in the cache keys."""
+        monkeypatch.setenv("DESPAUTH_PASSWORD", "super-secret-value")  # pragma: allowlist secret
+
+        ConfigurationFactory.load_config("highway")
+
+        assert "super-secret-value" not in repr(list(ConfigurationFactory._CONFIG_CACHE))
+
+    def test_load_config_cache_is_bounded(self, monkeypatch):
+        """Test that the cache evicts the oldest entries beyond its maximum size."""
+        monkeypatch.setattr(ConfigurationFactory, "_CONFIG_CACHE_MAX_SIZE", 2)
+        with patch("conflator.Conflator") as mock_conflator:
+            mock_conflator.return_value.load.return_value = BaseConfig()
+            for service in ("highway", "cacheb", "eden"):
+                ConfigurationFactory.load_config(service)
+
+        assert len(ConfigurationFactory._CONFIG_CACHE) == 2
+
     def test_load_config_from_custom_path_missing_file_raises(self, tmp_path: Path):
         """Test missing custom config path raises ValueError."""
         missing = tmp_path / "missing.yaml"
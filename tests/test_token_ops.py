@@ -5,9 +5,12 @@ Focused tests that verify error handling branches and core logic
 in _exchange_token and _verify_and_decode methods.
 """
 
+import json
 import pytest
+import requests
 import time
 from unittest.mock import MagicMock, patch
+from urllib.parse import parse_qs
 
 from destinepyauth.authentication import AuthenticationService
 from destinepyauth.configs import BaseConfig, BaseExchangeConfig
@@ -39,12 +42,67 @@ class TestTokenExchange:
         # Mock a 400 error response with JSON error
         mock_response = MagicMock()
         mock_response.status_code = 400
-        mock_response.json.return_value = {"error": "invalid_grant", "error_description": "Token expired"}
+        mock_response.content = json.dumps(
+            {"error": "invalid_grant", "error_description": "Token expired"}
+        ).encode()
 
         with patch.object(auth_service.session, "post", return_value=mock_response):
             with pytest.raises(AuthenticationError, match="Exchange failed: Token expired"):
                 auth_service._exchange_token("expired_token")
 
+    def test_exchange_error_with_non_json_body_is_truncated(self):
+        """Test that a non-JSON error body is reported as a short excerpt."""
+        exchange_config = BaseExchangeConfig(
+            token_url="https://exchange.example.com/token",
+            client_id="client",
+            audience="audience",
+            subject_issuer="issuer",
+        )
+        config = BaseConfig(iam_client="test", exchange_config=exchange_config)
+        auth_service = AuthenticationService(config=config)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 502
+        mock_response.content = b"<html>" + b"x" * 1_000_000 + b"</html>"
+
+        with patch.object(auth_service.session, "post", return_value=mock_response):
+            with pytest.raises(AuthenticationError) as exc_info:
+                auth_service._exchange_token("some_token")
+
+        assert str(exc_info.value) == "Exchange failed: <html>" + "x" * 194
+
+    def test_exchange_fails_on_non_json_200_response(self):
+        """Test that a 200 response with a non-JSON body raises AuthenticationError."""
+        exchange_config = BaseExchangeConfig(
+            token_url="https://exchange.example.com/token",
+            client_id="client",
+            audience="audience",
+            subject_issuer="issuer",
+        )
+        config = BaseConfig(iam_client="test", exchange_config=exchange_config)
+        auth_service = AuthenticationService(config=config)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>Captive portal</html>"
+
+        with patch.object(auth_service.session, "post", return_value=mock_response):
+            with pytest.raises(AuthenticationError, match="Invalid JSON in exchange response"):
+                auth_service._exchange_token("original_token")
+
+    def test_code_exchange_fails_on_non_json_200_response(self):
+        """Test that a non-JSON 200 from the token endpoint raises AuthenticationError."""
+        config = BaseConfig(iam_client="test")
+        auth_service = AuthenticationService(config=config)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b"<html>Captive portal</html>"
+
+        with patch.object(auth_service.session, "post", return_value=mock_response):
+            with pytest.raises(AuthenticationError, match="Invalid JSON in token response"):
+                auth_service._exchange_code_for_token("auth_code")
+
     def test_exchange_fails_when_access_token_missing(self):
         """Test that 200 response without access_token raises error."""
         exchange_config = BaseExchangeConfig(
@@ -59,7 +117,7 @@ class TestTokenExchange:
         # Mock 200 response but missing access_token field
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"token_type": "Bearer"}  # No access_token!
+        mock_response.content = json.dumps({"token_type": "Bearer"}).encode()  # No access_token!
 
         with patch.object(auth_service.session, "post", return_value=mock_response):
             with pytest.raises(AuthenticationError, match="No access token in exchange response"):
@@ -78,12 +136,40 @@ class TestTokenExchange:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"access_token": "new_exchanged_token_xyz"}
+        mock_response.content = json.dumps({"access_token": "new_exchanged_token_xyz"}).encode()
 
         with patch.object(auth_service.session, "post", return_value=mock_response):
             result = auth_service._exchange_token("original_token")
             assert result == "new_exchanged_token_xyz"
 
+    def test_exchange_posts_rfc8693_form_body(self):
+        """Test that the exchange request carries the expected urlencoded form fields."""
+        exchange_config = BaseExchangeConfig(
+            token_url="https://exchange.example.com/token",
+            client_id="client",
+            audience="audience",
+            subject_issuer=None,
+        )
+        config = BaseConfig(iam_client="test", exchange_config=exchange_config)
+        auth_service = AuthenticationService(config=config)
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"access_token": "new_token"}).encode()
+
+        with patch.object(auth_service.session, "post", return_value=mock_response) as mock_post:
+            auth_service._exchange_token("a+b/c=")
+
+        kwargs = mock_post.call_args.kwargs
+        assert kwargs["headers"] == {"Content-Type": "application/x-www-form-urlencoded"}
+        assert parse_qs(kwargs["data"].decode()) == {
+            "grant_type": ["urn:ietf:params:oauth:grant-type:token-exchange"],
+            "subject_token_type": ["urn:ietf:params:oauth:token-type:access_token"],
+            "subject_token": ["a+b/c="],
+            "client_id": ["client"],
+            "audience": ["audience"],
+        }
+
 
 class TestTokenVerification:
     """Tests for _verify_and_decode JWT verification."""
@@ -94,7 +180,7 @@ class TestTokenVerification:
         auth_service = AuthenticationService(config=config)
 
         # Mock the dependencies to make joserfc_jwt.decode raise an exception
-        with patch("destinepyauth.authentication.requests.get") as mock_get:
+        with patch.object(auth_service.session, "get") as mock_get:
             # Setup OIDC config and JWKS responses
             mock_oidc_response = MagicMock()
             mock_oidc_response.json.return_value = {"jwks_uri": "https://auth.example.com/jwks"}
@@ -105,9 +191,9 @@ class TestTokenVerification:
             mock_get.side_effect = [mock_oidc_response, mock_jwks_response]
 
             with (
-                patch("destinepyauth.authentication.KeySet.import_key_set", return_value=MagicMock()),
+                patch("joserfc.jwk.KeySet.import_key_set", return_value=MagicMock()),
                 patch(
-                    "destinepyauth.authentication.joserfc_jwt.decode",
+                    "joserfc.jwt.decode",
                     side_effect=Exception("Invalid signature"),
                 ),
             ):
@@ -129,7 +215,7 @@ class TestTokenVerification:
             "iat": now - 10,
         }
 
-        with patch("destinepyauth.authentication.requests.get") as mock_get:
+        with patch.object(auth_service.session, "get") as mock_get:
             # Setup OIDC config and JWKS responses
             mock_oidc_response = MagicMock()
             mock_oidc_response.json.return_value = {"jwks_uri": "https://auth.example.com/jwks"}
@@ -143,9 +229,20 @@ class TestTokenVerification:
             mock_token_obj.claims = expected_claims
 
             with (
-                patch("destinepyauth.authentication.KeySet.import_key_set", return_value=MagicMock()),
-                patch("destinepyauth.authentication.joserfc_jwt.decode", return_value=mock_token_obj),
+                patch("joserfc.jwk.KeySet.import_key_set", return_value=MagicMock()),
+                patch("joserfc.jwt.decode", return_value=mock_token_obj),
             ):
                 fake_token = "eyJhbGciOiJSUzI1NiIsImtpZCI6InRlc3Qta2V5In0.eyJpc3MiOiJodHRwczovL2F1dGguZXhhbXBsZS5jb20ifQ.fake_sig"  # pragma: allowlist secret
                 result = auth_service._verify_and_decode(fake_token)
                 assert result == expected_claims
+                mock_get.assert_any_call("https://auth.example.com/jwks", timeout=10)
+
+    def test_verify_raises_authentication_error_on_jwks_timeout(self):
+        """Test that a timeout while fetching discovery/JWKS surfaces as AuthenticationError."""
+        config = BaseConfig(iam_client="test")
+        auth_service = AuthenticationService(config=config)
+
+        with patch.object(auth_service.session, "get", side_effect=requests.Timeout("timed out")):
+            fake_token = "eyJhbGciOiJSUzI1NiIsImtpZCI6InRlc3Qta2V5In0.eyJpc3MiOiJodHRwczovL2F1dGguZXhhbXBsZS5jb20ifQ.fake_sig"  # pragma: allowlist secret
+            with pytest.raises(AuthenticationError, match="Failed to fetch JWKS: Connection timeout"):
+                auth_service._verify_and_decode(fake_token)